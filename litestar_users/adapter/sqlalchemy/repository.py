@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Generic
 
+from advanced_alchemy.exceptions import NotFoundError
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
 from litestar.exceptions import ImproperlyConfiguredException
+from sqlalchemy import update
 
 from litestar_users.adapter.sqlalchemy.protocols import SQLARoleT, SQLAUserT
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
 __all__ = ["SQLAlchemyRoleRepository", "SQLAlchemyUserRepository"]
@@ -36,6 +40,25 @@ class SQLAlchemyUserRepository(SQLAlchemyAsyncRepository[SQLAUserT], Generic[SQL
 
         return user
 
+    async def update_by_id(self, id_: UUID | int, data: dict[str, Any]) -> None:
+        """Update user attributes with a single UPDATE, without loading the user first.
+
+        Args:
+            id_: The user's primary key.
+            data: A mapping of attribute names to new values.
+
+        Raises:
+            NotFoundError: If no user exists with the given primary key.
+        """
+        result = await self.session.execute(
+            update(self.model_type).where(getattr(self.model_type, self.id_attribute) == id_).values(**data)
+        )
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            raise NotFoundError(f"No item found when one was expected: {id_}")
+
+        if self.auto_commit:
+            await self.session.commit()
+
 
 class SQLAlchemyRoleRepository(SQLAlchemyAsyncRepository[SQLARoleT], Generic[SQLARoleT, SQLAUserT]):
     """SQLAlchemy implementation of role persistence layer."""
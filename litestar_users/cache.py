@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+from time import monotonic
+from typing import Generic, TypeVar
+
+__all__ = ["TTLCache"]
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A bounded in-memory mapping whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Construct a TTLCache.
+
+        Args:
+            maxsize: The maximum number of entries to hold.
+            ttl: The number of seconds an entry remains valid for.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[K, tuple[float, V]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._data.get(key)  # type: ignore[call-overload]
+        return entry is not None and entry[0] > monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get the value stored for `key`, or `default` if it is missing or expired.
+
+        Args:
+            key: The cache key.
+            default: The value to return on a cache miss.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= monotonic():
+            del self._data[key]
+            return default
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Store `value` under `key`, evicting the oldest entries if the cache is full.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        now = monotonic()
+        # re-insert so that dict ordering keeps reflecting expiry ordering.
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._expire(now)
+        while len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def _expire(self, now: float) -> None:
+        # entries share a single ttl, so insertion order is expiry order.
+        expired: list[K] = []
+        for key, (expires_at, _) in self._data.items():
+            if expires_at > now:
+                break
+            expired.append(key)
+        for key in expired:
+            del self._data[key]
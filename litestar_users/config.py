@@ -90,6 +90,21 @@ class PasswordResetHandlerConfig:
     """The path for the forgot-password route."""
     reset_path: str = "/reset-password"
     """The path for the reset-password route."""
+    forgot_password_cooldown: timedelta | None = None
+    """Optional window during which repeated forgot-password requests for the same email are dropped.
+
+    Defaults to `None`, which initiates a password reset for every request.
+    """
+    send_token_in_background: bool = False
+    """Whether to send the password reset token in a background task, after the response has been sent.
+
+    Notes:
+        - This calls [create_password_reset_token][litestar_users.service.BaseUserService.create_password_reset_token]
+        and [send_password_reset_token][litestar_users.service.BaseUserService.send_password_reset_token] directly,
+        bypassing `initiate_password_reset`.
+        - The user instance passed to `send_password_reset_token` is detached from its session by then, so the session
+        should be configured with `expire_on_commit=False`.
+    """
     tags: list[str] | None = None
     """A list of string tags to append to the schema of the route handler(s)."""
 
@@ -103,6 +118,17 @@ class RegisterHandlerConfig:
 
     path: str = "/register"
     """The path for the registration/signup route."""
+    send_token_in_background: bool = False
+    """Whether to send the verification token in a background task, after the response has been sent.
+
+    Notes:
+        - This calls [create_verification_token][litestar_users.service.BaseUserService.create_verification_token]
+        and [send_verification_token][litestar_users.service.BaseUserService.send_verification_token] directly,
+        bypassing `initiate_verification`. `post_registration_hook` therefore runs before the token is sent.
+        - The user instance passed to `send_verification_token` is detached from its session by then, so the session
+        should be configured with `expire_on_commit=False`.
+        - A service that overrides `register` must accept the `defer_verification` keyword argument.
+    """
     tags: list[str] | None = None
     """A list of string tags to append to the schema of the route handler(s)."""
 
@@ -120,6 +146,11 @@ class RoleManagementHandlerConfig:
     """The path for the role assignment router."""
     revoke_role_path: str = "/revoke"
     """The path for the role revokement router."""
+    minimal_assignment_response: bool = False
+    """Whether the role assignment and revokement routes respond with the submitted user and role IDs only.
+
+    Defaults to `False`, which responds with the updated user.
+    """
     guards: list[Guard] = field(default_factory=list)
     """A list of callable [Guards][litestar.types.Guard] that determines who is authorized to manage roles."""
     opt: dict[str, Any] = field(default_factory=dict)
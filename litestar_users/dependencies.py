@@ -29,6 +29,8 @@ def provide_user_service(state: State, request: Request) -> BaseUserService:
     sqlalchemy_config = get_sqlalchemy_plugin(request.app)._config
     if not isinstance(sqlalchemy_config, SQLAlchemyAsyncConfig):
         raise ImproperlyConfiguredException("SQLAlchemy config must be of type `SQLAlchemyAsyncConfig`")
+    # the session is cached on the request scope, so the retrieve-user handler and every
+    # dependency resolved within this request share a single connection from the pool.
     session = sqlalchemy_config.provide_session(state=state, scope=request.scope)
 
     litestar_users_config = get_litestar_users_plugin(request.app)._config
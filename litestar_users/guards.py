@@ -12,6 +12,20 @@ if TYPE_CHECKING:
     from litestar.handlers import BaseRouteHandler
     from litestar.types import Guard
 
+ROLE_NAMES_STATE_KEY = "_litestar_users_role_names"
+
+
+def _get_user_role_names(connection: ASGIConnection) -> frozenset[str]:
+    """Get the names of the authenticated user's roles, cached on the connection state.
+
+    Multiple guards on the same route share a single materialization.
+    """
+    role_names: frozenset[str] | None = connection.state.get(ROLE_NAMES_STATE_KEY)
+    if role_names is None:
+        role_names = frozenset(role.name for role in connection.user.roles)
+        connection.state[ROLE_NAMES_STATE_KEY] = role_names
+    return role_names
+
 
 def roles_accepted(*roles: str) -> Guard:
     """Get a [Guard][litestar.types.Guard] callable and inject authorized role names.
@@ -22,10 +36,11 @@ def roles_accepted(*roles: str) -> Guard:
     Returns:
         Litestar [Guard][litestar.types.callable_types.Guard] callable
     """
+    accepted_roles = frozenset(roles)
 
     def roles_accepted_guard(connection: ASGIConnection, _: BaseRouteHandler) -> None:
         """Authorize a request if any of the user's roles matches any of the supplied roles."""
-        if any(role.name in roles for role in connection.user.roles):
+        if not accepted_roles.isdisjoint(_get_user_role_names(connection)):
             return
         raise NotAuthorizedException()
 
@@ -38,11 +53,11 @@ def roles_required(*roles: str) -> Guard:
     Args:
         roles: Iterable of authorized role names.
     """
+    required_roles = frozenset(roles)
 
     def roles_required_guard(connection: ASGIConnection, _: BaseRouteHandler) -> None:
         """Authorize a request if the user's roles matches all of the supplied roles."""
-        user_role_names = [role.name for role in connection.user.roles]
-        if all(role in user_role_names for role in roles):
+        if required_roles.issubset(_get_user_role_names(connection)):
             return
         raise NotAuthorizedException()
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from advanced_alchemy.exceptions import RepositoryError
@@ -31,6 +31,8 @@ __all__ = ["LitestarUsersPlugin"]
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from click import Group
     from litestar import Router
     from litestar.config.app import AppConfig
@@ -160,6 +162,8 @@ class LitestarUsersPlugin(InitPluginProtocol, CLIPluginProtocol):
                 get_password_reset_handler(
                     forgot_path=self._config.password_reset_handler_config.forgot_path,
                     reset_path=self._config.password_reset_handler_config.reset_path,
+                    forgot_password_cooldown=self._config.password_reset_handler_config.forgot_password_cooldown,
+                    send_token_in_background=self._config.password_reset_handler_config.send_token_in_background,
                     tags=self._config.password_reset_handler_config.tags,
                 )
             )
@@ -169,6 +173,7 @@ class LitestarUsersPlugin(InitPluginProtocol, CLIPluginProtocol):
                     path=self._config.register_handler_config.path,
                     user_registration_dto=self._config.user_registration_dto,
                     user_read_dto=self._config.user_read_dto,
+                    send_token_in_background=self._config.register_handler_config.send_token_in_background,
                     tags=self._config.register_handler_config.tags,
                 )
             )
@@ -181,6 +186,7 @@ class LitestarUsersPlugin(InitPluginProtocol, CLIPluginProtocol):
                     guards=self._config.role_management_handler_config.guards,
                     identifier_uri=self.get_role_identifier_uri(),
                     opt=self._config.role_management_handler_config.opt,
+                    minimal_assignment_response=self._config.role_management_handler_config.minimal_assignment_response,
                     role_create_dto=self._config.role_create_dto,  # type: ignore[arg-type]
                     role_read_dto=self._config.role_read_dto,  # type: ignore[arg-type]
                     role_update_dto=self._config.role_update_dto,  # type: ignore[arg-type]
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from typing import Sequence, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, cast
 
 from passlib.context import CryptContext
 
 __all__ = ["PasswordManager"]
 
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+@lru_cache(maxsize=8)
+def _get_crypt_context(hash_schemes: tuple[str, ...]) -> CryptContext:
+    # services are created per request, so share one context per scheme set across the process.
+    return CryptContext(schemes=hash_schemes, deprecated="auto")
+
+
 class PasswordManager:
     """Thin wrapper around `passlib`."""
 
@@ -18,7 +29,7 @@ class PasswordManager:
         """
         if hash_schemes is None:
             hash_schemes = ["argon2"]
-        self.context = CryptContext(schemes=hash_schemes, deprecated="auto")
+        self.context = _get_crypt_context(tuple(hash_schemes))
 
     def hash(self, password: str) -> str:
         """Create a password hash.
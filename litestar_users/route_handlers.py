@@ -12,13 +12,16 @@ from litestar import (
     post,
     put,
 )
+from litestar.background_tasks import BackgroundTask
 from litestar.di import Provide
-from litestar.exceptions import ImproperlyConfiguredException, NotAuthorizedException, PermissionDeniedException
-from litestar.security.jwt import JWTAuth, JWTCookieAuth
+from litestar.exceptions import NotAuthorizedException
 from litestar.security.session_auth.auth import SessionAuth
+from litestar.status_codes import HTTP_201_CREATED
 
 from litestar_users.adapter.sqlalchemy.protocols import SQLARoleT, SQLAUserT
+from litestar_users.cache import TTLCache
 from litestar_users.dependencies import provide_user_service
+from litestar_users.user_handlers import SESSION_USER_ID_KEY
 
 __all__ = [
     "get_auth_handler",
@@ -32,12 +35,14 @@ __all__ = [
 
 
 if TYPE_CHECKING:
+    from datetime import timedelta
     from uuid import UUID
 
     from advanced_alchemy.extensions.litestar.dto import SQLAlchemyDTO
     from litestar.contrib.pydantic import PydanticDTO
     from litestar.dto import DataclassDTO, DTOData, MsgspecDTO
     from litestar.handlers import HTTPRouteHandler
+    from litestar.security.jwt import JWTAuth, JWTCookieAuth
     from litestar.types import Guard
 
     from litestar_users.protocols import UserRegisterT
@@ -48,12 +53,18 @@ if TYPE_CHECKING:
     )
     from litestar_users.service import UserServiceType
 
+FORGOT_PASSWORD_CACHE_SIZE = 50_000
+
+# a single provider shared by every handler, so its signature is parsed only once.
+SERVICE_DEPENDENCY = Provide(provide_user_service, sync_to_thread=False)
+
 
 def get_registration_handler(
     path: str,
     user_registration_dto: type[DataclassDTO | MsgspecDTO | PydanticDTO],
     user_read_dto: type[SQLAlchemyDTO],
     tags: list[str] | None = None,
+    send_token_in_background: bool = False,
 ) -> HTTPRouteHandler:
     """Get registration route handlers.
 
@@ -62,19 +73,30 @@ def get_registration_handler(
         user_registration_dto: A subclass of [UserCreateDTO][litestar_users.schema.UserCreateDTO]
         user_read_dto: A subclass of [UserReadDTO][litestar_users.schema.UserReadDTO]
         tags: A list of string tags to append to the schema of the route handler.
+        send_token_in_background: Whether to send the verification token after the response has been sent.
     """
 
     @post(
         path,
         dto=user_registration_dto,
         return_dto=user_read_dto,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
+        dependencies={"service": SERVICE_DEPENDENCY},
         exclude_from_auth=True,
         tags=tags,
     )
-    async def register(data: DTOData[UserRegisterT], service: UserServiceType, request: Request) -> SQLAUserT:
+    async def register(data: DTOData[UserRegisterT], service: UserServiceType, request: Request) -> Response[SQLAUserT]:
         """Register a new user."""
-        return cast(SQLAUserT, await service.register(data.as_builtins(), request))
+        if not send_token_in_background:
+            user = await service.register(data.as_builtins(), request)
+            return Response(content=cast(SQLAUserT, user), status_code=HTTP_201_CREATED)
+
+        user = await service.register(data.as_builtins(), request, defer_verification=True)
+        background = (
+            BackgroundTask(service.send_verification_token, user, service.create_verification_token(user))
+            if service.require_verification_on_registration
+            else None
+        )
+        return Response(content=cast(SQLAUserT, user), status_code=HTTP_201_CREATED, background=background)
 
     return register
 
@@ -95,7 +117,7 @@ def get_verification_handler(
     @post(
         path,
         return_dto=user_read_dto,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
+        dependencies={"service": SERVICE_DEPENDENCY},
         exclude_from_auth=True,
         tags=tags,
     )
@@ -131,7 +153,6 @@ def get_auth_handler(
     @post(
         login_path,
         return_dto=user_read_dto,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         exclude_from_auth=True,
         tags=tags,
         opt=opt,
@@ -142,21 +163,18 @@ def get_auth_handler(
         request: Request,
     ) -> SQLAUserT:
         """Authenticate a user."""
-        if not isinstance(auth_backend, SessionAuth):
-            raise ImproperlyConfiguredException("session login can only be used with SesssionAuth")
-
-        user = await service.authenticate(data, request)
-        if user is None:
+        try:
+            user = await service.login(data, request, require_verified=False)
+        except NotAuthorizedException:
             request.clear_session()
-            raise NotAuthorizedException(detail="login failed, invalid input")
+            raise
 
-        request.set_session({"user_id": user.id})  # TODO: move and make configurable
+        request.set_session({SESSION_USER_ID_KEY: user.id})
         return cast(SQLAUserT, user)
 
     @post(
         login_path,
         return_dto=user_read_dto,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         exclude_from_auth=True,
         tags=tags,
         opt=opt,
@@ -167,21 +185,11 @@ def get_auth_handler(
         request: Request,
     ) -> Response[SQLAUserT]:
         """Authenticate a user."""
+        user = await service.login(data, request)
+        return jwt_backend.login(identifier=str(user.id), response_body=cast(SQLAUserT, user))
 
-        if not isinstance(auth_backend, (JWTAuth, JWTCookieAuth)):
-            raise ImproperlyConfiguredException("jwt login can only be used with JWTAuth")
-
-        user = await service.authenticate(data, request)
-        if user is None:
-            raise NotAuthorizedException(detail="login failed, invalid input")
-
-        if user.is_verified is False:
-            raise PermissionDeniedException(detail="not verified")
-
-        return auth_backend.login(identifier=str(user.id), response_body=cast(SQLAUserT, user))
-
-    @post(logout_path, tags=tags)
-    async def logout(request: Request) -> None:
+    @post(logout_path, sync_to_thread=False, tags=tags)
+    def logout(request: Request) -> None:
         """Log an authenticated user out."""
         request.clear_session()
 
@@ -189,9 +197,15 @@ def get_auth_handler(
     if isinstance(auth_backend, SessionAuth):
         route_handlers.extend([login_session, logout])
     else:
+        # only the matching login handler is registered, so narrow the backend once here.
+        jwt_backend = cast("JWTAuth | JWTCookieAuth", auth_backend)
         route_handlers.append(login_jwt)
 
-    return Router(path="/", route_handlers=route_handlers)
+    return Router(
+        path="/",
+        route_handlers=route_handlers,
+        dependencies={"service": SERVICE_DEPENDENCY},
+    )
 
 
 def get_current_user_handler(
@@ -211,8 +225,8 @@ def get_current_user_handler(
         tags: A list of string tags to append to the schema of the route handlers.
     """
 
-    @get(path, return_dto=user_read_dto, tags=tags, opt=opt)
-    async def get_current_user(request: Request[SQLAUserT, Any, Any]) -> SQLAUserT:
+    @get(path, return_dto=user_read_dto, sync_to_thread=False, tags=tags, opt=opt)
+    def get_current_user(request: Request[SQLAUserT, Any, Any]) -> SQLAUserT:
         """Get current user info."""
 
         return request.user
@@ -221,7 +235,6 @@ def get_current_user_handler(
         path,
         dto=user_update_dto,
         return_dto=user_read_dto,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
         opt=opt,
     )
@@ -232,33 +245,74 @@ def get_current_user_handler(
     ) -> SQLAUserT:
         """Update the current user."""
         data.id = request.user.id  # type: ignore[assignment]
-        return cast(SQLAUserT, await service.update_user(data=data))
+        return cast(SQLAUserT, await service.update_user(data))
 
-    return Router(path="/", route_handlers=[get_current_user, update_current_user])
+    return Router(
+        path="/",
+        route_handlers=[get_current_user, update_current_user],
+        dependencies={"service": SERVICE_DEPENDENCY},
+    )
 
 
-def get_password_reset_handler(forgot_path: str, reset_path: str, tags: list[str] | None = None) -> Router:
+def get_password_reset_handler(
+    forgot_path: str,
+    reset_path: str,
+    tags: list[str] | None = None,
+    forgot_password_cooldown: timedelta | None = None,
+    send_token_in_background: bool = False,
+) -> Router:
     """Get forgot-password and reset-password route handlers.
 
     Args:
         forgot_path: The path for the forgot-password router.
         reset_path: The path for the reset-password router.
         tags: A list of string tags to append to the schema of the route handlers.
+        forgot_password_cooldown: Optional window during which repeated requests for the same email are dropped.
+        send_token_in_background: Whether to send the reset token after the response has been sent.
     """
 
+    recent_requests: TTLCache[str, bool] | None = (
+        TTLCache(maxsize=FORGOT_PASSWORD_CACHE_SIZE, ttl=forgot_password_cooldown.total_seconds())
+        if forgot_password_cooldown
+        else None
+    )
+
+    def remember(email: str) -> None:
+        # only record completed requests, so a failed lookup or send doesn't swallow the user's retry.
+        if recent_requests is not None:
+            recent_requests.set(email, True)
+
+    async def send_password_reset_token(service: UserServiceType, user: SQLAUserT, token: str, email: str) -> None:
+        await service.send_password_reset_token(user, token)
+        remember(email)
+
     @post(
         forgot_path,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         exclude_from_auth=True,
         tags=tags,
     )
-    async def forgot_password(data: ForgotPasswordSchema, service: UserServiceType) -> None:
-        await service.initiate_password_reset(data.email)
-        return
+    async def forgot_password(data: ForgotPasswordSchema, service: UserServiceType) -> Response[None]:
+        email = data.email.lower()
+        if recent_requests is not None and email in recent_requests:
+            return Response(content=None, status_code=HTTP_201_CREATED)
+
+        if not send_token_in_background:
+            await service.initiate_password_reset(data.email)
+            remember(email)
+            return Response(content=None, status_code=HTTP_201_CREATED)
+
+        reset = await service.create_password_reset_token(data.email)
+        if reset is None:
+            remember(email)
+            return Response(content=None, status_code=HTTP_201_CREATED)
+        return Response(
+            content=None,
+            status_code=HTTP_201_CREATED,
+            background=BackgroundTask(send_password_reset_token, service, *reset, email),
+        )
 
     @post(
         reset_path,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         exclude_from_auth=True,
         tags=tags,
     )
@@ -266,7 +320,11 @@ def get_password_reset_handler(forgot_path: str, reset_path: str, tags: list[str
         await service.reset_password(data.token, data.password)
         return
 
-    return Router(path="/", route_handlers=[forgot_password, reset_password])
+    return Router(
+        path="/",
+        route_handlers=[forgot_password, reset_password],
+        dependencies={"service": SERVICE_DEPENDENCY},
+    )
 
 
 def get_user_management_handler(
@@ -299,7 +357,6 @@ def get_user_management_handler(
         return_dto=user_read_dto,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def get_user(user_id: Union[UUID, int], service: UserServiceType) -> SQLAUserT:
@@ -313,7 +370,6 @@ def get_user_management_handler(
         return_dto=user_read_dto,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def update_user(user_id: Union[UUID, int], data: SQLAUserT, service: UserServiceType) -> SQLAUserT:
@@ -327,7 +383,6 @@ def get_user_management_handler(
         status_code=200,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def delete_user(user_id: Union[UUID, int], service: UserServiceType) -> SQLAUserT:
@@ -335,7 +390,11 @@ def get_user_management_handler(
 
         return cast(SQLAUserT, await service.delete_user(user_id))
 
-    return Router(path=path_prefix, route_handlers=[get_user, update_user, delete_user])
+    return Router(
+        path=path_prefix,
+        route_handlers=[get_user, update_user, delete_user],
+        dependencies={"service": SERVICE_DEPENDENCY},
+    )
 
 
 def get_role_management_handler(
@@ -350,6 +409,7 @@ def get_role_management_handler(
     user_read_dto: type[SQLAlchemyDTO],  # pyright: ignore
     opt: dict[str, Any] | None = None,
     tags: list[str] | None = None,
+    minimal_assignment_response: bool = False,
 ) -> Router:
     """Get role management route handlers.
 
@@ -368,6 +428,7 @@ def get_role_management_handler(
         role_update_dto: A subclass of [RoleUpdateDTO][litestar_users.schema.RoleUpdateDTO]
         user_read_dto: A subclass of [UserReadDTO][litestar_users.schema.UserReadDTO]
         tags: A list of string tags to append to the schema of the route handlers.
+        minimal_assignment_response: Whether role assignment and revocation respond with the user/role ID pair only.
     """
 
     @post(
@@ -375,7 +436,6 @@ def get_role_management_handler(
         return_dto=role_read_dto,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def create_role(data: SQLARoleT, service: UserServiceType) -> SQLARoleT:
@@ -388,7 +448,6 @@ def get_role_management_handler(
         return_dto=role_read_dto,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def update_role(role_id: Union[UUID, int], data: SQLARoleT, service: UserServiceType) -> SQLARoleT:
@@ -402,7 +461,6 @@ def get_role_management_handler(
         status_code=200,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def delete_role(role_id: Union[UUID, int], service: UserServiceType) -> SQLARoleT:
@@ -415,7 +473,6 @@ def get_role_management_handler(
         path=assign_role_path,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def assign_role(data: UserRoleSchema, service: UserServiceType) -> SQLAUserT:
@@ -428,7 +485,6 @@ def get_role_management_handler(
         path=revoke_role_path,
         guards=guards,
         opt=opt,
-        dependencies={"service": Provide(provide_user_service, sync_to_thread=False)},
         tags=tags,
     )
     async def revoke_role(data: UserRoleSchema, service: UserServiceType) -> SQLAUserT:
@@ -436,4 +492,28 @@ def get_role_management_handler(
 
         return cast(SQLAUserT, await service.revoke_role(data.user_id, data.role_id))
 
-    return Router(path_prefix, route_handlers=[create_role, assign_role, revoke_role, update_role, delete_role])
+    @put(path=assign_role_path, guards=guards, opt=opt, tags=tags)
+    async def assign_role_minimal(data: UserRoleSchema, service: UserServiceType) -> UserRoleSchema:
+        """Assign a role to a user."""
+
+        await service.assign_role(data.user_id, data.role_id)
+        return data
+
+    @put(path=revoke_role_path, guards=guards, opt=opt, tags=tags)
+    async def revoke_role_minimal(data: UserRoleSchema, service: UserServiceType) -> UserRoleSchema:
+        """Revoke a role from a user."""
+
+        await service.revoke_role(data.user_id, data.role_id)
+        return data
+
+    route_handlers = [create_role, update_role, delete_role]
+    if minimal_assignment_response:
+        route_handlers.extend([assign_role_minimal, revoke_role_minimal])
+    else:
+        route_handlers.extend([assign_role, revoke_role])
+
+    return Router(
+        path_prefix,
+        route_handlers=route_handlers,
+        dependencies={"service": SERVICE_DEPENDENCY},
+    )
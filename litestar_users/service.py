@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Generic, Sequence, TypeVar
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from uuid import UUID
 
 from advanced_alchemy.exceptions import IntegrityError, NotFoundError
+from anyio import to_thread
 from jose import JWTError
-from litestar.exceptions import ImproperlyConfiguredException
+from litestar.exceptions import ImproperlyConfiguredException, NotAuthorizedException, PermissionDeniedException
 from litestar.security.jwt.token import Token
 from sqlalchemy import func
 
 from litestar_users.adapter.sqlalchemy.protocols import SQLARoleT, SQLAUserT
+from litestar_users.cache import TTLCache
 from litestar_users.exceptions import InvalidTokenException
 from litestar_users.password import PasswordManager
 
@@ -18,6 +20,8 @@ __all__ = ["BaseUserService"]
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from advanced_alchemy.filters import StatementFilter
     from advanced_alchemy.repository import LoadSpec
     from advanced_alchemy.repository.typing import OrderingPair
@@ -27,6 +31,14 @@ if TYPE_CHECKING:
     from litestar_users.adapter.sqlalchemy.repository import SQLAlchemyRoleRepository, SQLAlchemyUserRepository
     from litestar_users.schema import AuthenticationSchema
 
+TOKEN_EXPIRATION = timedelta(hours=24)
+"""How long tokens issued by `generate_token` remain valid for."""
+TOKEN_CACHE_SIZE = 1024
+TOKEN_CACHE_TTL = 600
+"""The number of seconds a decoded token is kept, at most, before it is decoded again."""
+
+_token_cache: TTLCache[tuple[str, str], Token] = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL)
+
 
 class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
     """Main user management interface."""
@@ -83,21 +95,24 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
 
         return await self.user_repository.add(user)
 
-    async def register(self, data: dict[str, Any], request: Request | None = None) -> SQLAUserT:
+    async def register(
+        self, data: dict[str, Any], request: Request | None = None, defer_verification: bool = False
+    ) -> SQLAUserT:
         """Register a new user and optionally run custom business logic.
 
         Args:
             data: User creation data transfer object.
             request: The litestar request that initiated the action.
+            defer_verification: Skip initiating the verification flow, leaving it to the caller.
         """
         await self.pre_registration_hook(data, request)
 
-        data["password_hash"] = self.password_manager.hash(data.pop("password"))
+        data["password_hash"] = await to_thread.run_sync(self.password_manager.hash, data.pop("password"))
 
         verify = not self.require_verification_on_registration
         user = await self.add_user(self.user_model(**data), verify=verify)  # type: ignore[arg-type]
 
-        if self.require_verification_on_registration:
+        if self.require_verification_on_registration and not defer_verification:
             await self.initiate_verification(user)
 
         await self.post_registration_hook(user, request)
@@ -161,7 +176,7 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
         """
         # password is not hashed yet, despite attribute name.
         if data.password_hash:
-            data.password_hash = self.password_manager.hash(data.password_hash)
+            data.password_hash = await to_thread.run_sync(self.password_manager.hash, data.password_hash)
 
         return await self.user_repository.update(data)
 
@@ -188,19 +203,19 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
         # supply the result later.
         should_proceed = await self.pre_login_hook(data, request)
 
-        try:
-            user = await self.user_repository.get_one(
-                func.lower(getattr(self.user_model, self.user_auth_identifier))
-                == getattr(data, self.user_auth_identifier).lower(),
-                load=load,
-            )
-        except NotFoundError:
+        user = await self.user_repository.get_one_or_none(
+            func.lower(getattr(self.user_model, self.user_auth_identifier))
+            == getattr(data, self.user_auth_identifier).lower(),
+            load=load,
+        )
+        if user is None:
             # trigger passlib's `dummy_verify` method
-            self.password_manager.verify_and_update(data.password, None)
+            await to_thread.run_sync(self.password_manager.verify_and_update, data.password, None)
             return None
 
-        password_verified, new_password_hash = self.password_manager.verify_and_update(
-            data.password, user.password_hash
+        # hash verification is CPU bound, keep it off the event loop.
+        password_verified, new_password_hash = await to_thread.run_sync(
+            self.password_manager.verify_and_update, data.password, user.password_hash
         )
         if new_password_hash is not None:
             user = await self.user_repository._update(user, {"password_hash": new_password_hash})
@@ -212,6 +227,27 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
 
         return user
 
+    async def login(self, data: Any, request: Request | None = None, require_verified: bool = True) -> SQLAUserT:
+        """Authenticate a user, raising if the login cannot proceed.
+
+        Args:
+            data: User authentication data transfer object.
+            request: The litestar request that initiated the action.
+            require_verified: Whether to reject users that have not been verified yet.
+
+        Raises:
+            NotAuthorizedException: If authentication fails.
+            PermissionDeniedException: If `require_verified` is set and the user is not verified.
+        """
+        user = await self.authenticate(data, request)
+        if user is None:
+            raise NotAuthorizedException(detail="login failed, invalid input")
+
+        if require_verified and user.is_verified is False:
+            raise PermissionDeniedException(detail="not verified")
+
+        return user
+
     def generate_token(self, user_id: UUID | int, aud: str) -> str:
         """Generate a limited time valid JWT.
 
@@ -220,7 +256,7 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
             aud: Context of the token
         """
         token = Token(
-            exp=datetime.now() + timedelta(seconds=60 * 60 * 24),  # noqa: DTZ005
+            exp=datetime.now(timezone.utc) + TOKEN_EXPIRATION,
             sub=str(user_id),
             aud=aud,
         )
@@ -235,8 +271,15 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
         Notes:
             - The user verification flow is not initiated when `require_verification_on_registration` is set to `False`.
         """
-        token = self.generate_token(user.id, aud="verify")
-        await self.send_verification_token(user, token)
+        await self.send_verification_token(user, self.create_verification_token(user))
+
+    def create_verification_token(self, user: SQLAUserT) -> str:
+        """Generate a verification token for the given user.
+
+        Args:
+            user: The user requesting verification.
+        """
+        return self.generate_token(user.id, aud="verify")
 
     async def send_verification_token(self, user: SQLAUserT, token: str) -> None:
         """Execute custom logic to send the verification token to the relevant user.
@@ -281,11 +324,24 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
         Args:
             email: Email of the user who has forgotten their password.
         """
+        reset = await self.create_password_reset_token(email)
+        if reset is None:
+            return
+        await self.send_password_reset_token(*reset)
+
+    async def create_password_reset_token(self, email: str) -> tuple[SQLAUserT, str] | None:
+        """Look up a user by email and generate a password reset token for them.
+
+        Args:
+            email: Email of the user who has forgotten their password.
+
+        Returns:
+            The user and their encoded reset token, or `None` if no user has the given email.
+        """
         user = await self.get_user_by(email=email)  # TODO: something about timing attacks.
         if user is None:
-            return
-        token = self.generate_token(user.id, aud="reset_password")
-        await self.send_password_reset_token(user, token)
+            return None
+        return user, self.generate_token(user.id, aud="reset_password")
 
     async def send_password_reset_token(self, user: SQLAUserT, token: str) -> None:
         """Execute custom logic to send the password reset token to the relevant user.
@@ -314,10 +370,9 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
             user_id: UUID | int = UUID(token.sub)
         except ValueError:
             user_id = int(token.sub)
+        password_hash = await to_thread.run_sync(self.password_manager.hash, password)
         try:
-            await self.user_repository.update(
-                self.user_model(id=user_id, password_hash=self.password_manager.hash(password))  # type: ignore[arg-type]
-            )
+            await self.user_repository.update_by_id(user_id, {"password_hash": password_hash})
         except NotFoundError as e:
             raise InvalidTokenException from e
 
@@ -398,14 +453,20 @@ class BaseUserService(Generic[SQLAUserT, SQLARoleT]):  # pylint: disable=R0904
         return
 
     def _decode_and_verify_token(self, encoded_token: str, context: str) -> Token:
-        try:
-            token = Token.decode(
-                encoded_token=encoded_token,
-                secret=self.secret,
-                algorithm="HS256",
-            )
-        except JWTError as e:
-            raise InvalidTokenException from e
+        # services are created per request, so decoded tokens are cached at module level.
+        # only successfully decoded tokens are stored, keyed on the secret that signed them.
+        cache_key = (self.secret, encoded_token)
+        token = _token_cache.get(cache_key)
+        if token is None or token.exp <= datetime.now(timezone.utc):
+            try:
+                token = Token.decode(
+                    encoded_token=encoded_token,
+                    secret=self.secret,
+                    algorithm="HS256",
+                )
+            except JWTError as e:
+                raise InvalidTokenException from e
+            _token_cache.set(cache_key, token)
 
         if token.aud != context:
             raise InvalidTokenException(f"aud value must be {context}")
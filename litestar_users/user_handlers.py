@@ -11,7 +11,7 @@ from sqlalchemy.orm import Load
 
 from litestar_users.utils import get_litestar_users_plugin, get_sqlalchemy_plugin
 
-__all__ = ["jwt_retrieve_user_handler", "session_retrieve_user_handler"]
+__all__ = ["SESSION_USER_ID_KEY", "jwt_retrieve_user_handler", "session_retrieve_user_handler"]
 
 
 if TYPE_CHECKING:
@@ -22,6 +22,9 @@ if TYPE_CHECKING:
     from litestar_users.adapter.sqlalchemy.protocols import SQLAUserT
     from litestar_users.adapter.sqlalchemy.repository import SQLAlchemyUserRepository
 
+SESSION_USER_ID_KEY = "user_id"
+"""The session key under which the authenticated user's ID is stored."""
+
 
 def _get_user_repository(connection: ASGIConnection) -> SQLAlchemyUserRepository:
     sqlalchemy_config = get_sqlalchemy_plugin(connection.app)._config
@@ -48,6 +51,21 @@ def _get_load_options(connection: ASGIConnection) -> LoadSpec | None:
     return load_options
 
 
+async def _get_active_user(user_id: Any, connection: ASGIConnection) -> SQLAUserT | None:
+    try:
+        parsed_user_id: UUID | int = UUID(user_id)
+    except ValueError:
+        parsed_user_id = int(user_id)
+    repository = _get_user_repository(connection)
+    try:
+        user = await repository.get(parsed_user_id, load=_get_load_options(connection))
+    except NotFoundError:
+        return None
+    if user.is_active and user.is_verified:
+        return user  # type: ignore[no-any-return]
+    return None
+
+
 async def session_retrieve_user_handler(session: dict[str, Any], connection: ASGIConnection) -> SQLAUserT | None:
     """Get a user from the database based on session info.
 
@@ -55,21 +73,10 @@ async def session_retrieve_user_handler(session: dict[str, Any], connection: ASG
         session: Litestar session.
         connection: The ASGI connection.
     """
-    repository = _get_user_repository(connection)
-    try:
-        user_id = session.get("user_id")
-        if user_id is None:
-            return None
-        try:
-            user_id = UUID(user_id)
-        except ValueError:
-            user_id = int(user_id)
-        user = await repository.get(user_id, load=_get_load_options(connection))
-        if user.is_active and user.is_verified:
-            return user  # type: ignore[no-any-return]
-    except NotFoundError:
-        pass
-    return None
+    user_id = session.get(SESSION_USER_ID_KEY)
+    if user_id is None:
+        return None
+    return await _get_active_user(user_id, connection)
 
 
 async def jwt_retrieve_user_handler(token: Token, connection: ASGIConnection) -> SQLAUserT | None:
@@ -79,16 +86,4 @@ async def jwt_retrieve_user_handler(token: Token, connection: ASGIConnection) ->
         token: Encoded JWT.
         connection: The ASGI connection.
     """
-    repository = _get_user_repository(connection)
-    try:
-        user_id: UUID | int | None = None
-        try:
-            user_id = UUID(token.sub)
-        except ValueError:
-            user_id = int(token.sub)
-        user = await repository.get(user_id, load=_get_load_options(connection))
-        if user.is_active and user.is_verified:
-            return user  # type: ignore[no-any-return]
-    except NotFoundError:
-        pass
-    return None
+    return await _get_active_user(token.sub, connection)
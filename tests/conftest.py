@@ -1,5 +1,17 @@
+from collections.abc import Iterator
+
+import pytest
+
 from litestar_users.password import PasswordManager
+from litestar_users.service import _token_cache
 from tests.constants import HASH_SCHEMES
 
 pytest_plugins = ["tests.docker_service_fixtures"]
 password_manager = PasswordManager(hash_schemes=HASH_SCHEMES)
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache() -> Iterator[None]:
+    _token_cache.clear()
+    yield
+    _token_cache.clear()
@@ -1,13 +1,43 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
 
+import pytest
+from litestar.security.jwt import Token
 from litestar.testing import TestClient
 
+from litestar_users.config import PasswordResetHandlerConfig
+from tests.constants import ENCODING_SECRET
+from tests.integration.conftest import UserService
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from litestar_users import LitestarUsersConfig
     from tests.integration.conftest import User
 
 
+@pytest.fixture()
+def send_password_reset_token() -> Iterator[MagicMock]:
+    with patch.object(UserService, "send_password_reset_token") as send_password_reset_token:
+        yield send_password_reset_token
+
+
+@pytest.fixture()
+def _forgot_password_cooldown(litestar_users_config: LitestarUsersConfig) -> None:
+    litestar_users_config.password_reset_handler_config = PasswordResetHandlerConfig(
+        forgot_password_cooldown=timedelta(minutes=1)
+    )
+
+
+@pytest.fixture()
+def _send_token_in_background(litestar_users_config: LitestarUsersConfig) -> None:
+    litestar_users_config.password_reset_handler_config = PasswordResetHandlerConfig(send_token_in_background=True)
+
+
 def test_forgot_password(client: TestClient, generic_user: User) -> None:
     response = client.post("/forgot-password", json={"email": generic_user.email})
     assert response.status_code == 201
@@ -23,3 +53,57 @@ def test_reset_password(client: TestClient, generic_user: User, generic_user_pas
         },
     )
     assert response.status_code == 201
+
+
+def test_reset_password_unknown_user(client: TestClient) -> None:
+    token = Token(
+        exp=datetime.now() + timedelta(seconds=60 * 60 * 24),
+        sub=str(uuid4()),
+        aud="reset_password",
+    )
+    response = client.post(
+        "/reset-password",
+        json={
+            "token": token.encode(secret=ENCODING_SECRET, algorithm="HS256"),
+            "password": "veryverystrong123",
+        },
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.usefixtures("_forgot_password_cooldown")
+def test_forgot_password_cooldown(client: TestClient, generic_user: User, send_password_reset_token: MagicMock) -> None:
+    for _ in range(3):
+        response = client.post("/forgot-password", json={"email": generic_user.email})
+        assert response.status_code == 201
+    assert send_password_reset_token.call_count == 1
+
+
+@pytest.mark.usefixtures("_forgot_password_cooldown")
+def test_forgot_password_cooldown_allows_retry_after_failure(
+    client: TestClient, generic_user: User, send_password_reset_token: MagicMock
+) -> None:
+    send_password_reset_token.side_effect = [RuntimeError("mail server unavailable"), None]
+    response = client.post("/forgot-password", json={"email": generic_user.email})
+    assert response.status_code == 500
+    response = client.post("/forgot-password", json={"email": generic_user.email})
+    assert response.status_code == 201
+    assert send_password_reset_token.call_count == 2
+
+
+@pytest.mark.usefixtures("_send_token_in_background")
+def test_forgot_password_send_token_in_background(
+    client: TestClient, generic_user: User, send_password_reset_token: MagicMock
+) -> None:
+    response = client.post("/forgot-password", json={"email": generic_user.email})
+    assert response.status_code == 201
+    send_password_reset_token.assert_called_once()
+
+
+@pytest.mark.usefixtures("_send_token_in_background")
+def test_forgot_password_send_token_in_background_unknown_email(
+    client: TestClient, send_password_reset_token: MagicMock
+) -> None:
+    response = client.post("/forgot-password", json={"email": "nobody@example.com"})
+    assert response.status_code == 201
+    send_password_reset_token.assert_not_called()
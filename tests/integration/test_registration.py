@@ -1,24 +1,40 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import ANY
+from typing import TYPE_CHECKING, Any
+from unittest.mock import ANY, patch
 
 import pytest
 
+from litestar_users.config import RegisterHandlerConfig
 from litestar_users.main import LitestarUsersPlugin
+from tests.integration.conftest import UserService
 
 if TYPE_CHECKING:
-    from litestar import Litestar
+    from litestar import Litestar, Request
     from litestar.testing import TestClient
 
+    from litestar_users import LitestarUsersConfig
     from tests.integration.conftest import User
 
 
+class LegacyRegisterUserService(UserService):
+    async def register(self, data: dict[str, Any], request: Request | None = None) -> User:  # type: ignore[override]
+        return await super().register(data, request)
+
+
 class TestRegistration:
     @pytest.fixture()
     def _disable_require_verification_on_registration(self, app: Litestar) -> None:
         app.plugins.get(LitestarUsersPlugin)._config.require_verification_on_registration = False
 
+    @pytest.fixture()
+    def _send_token_in_background(self, litestar_users_config: LitestarUsersConfig) -> None:
+        litestar_users_config.register_handler_config = RegisterHandlerConfig(send_token_in_background=True)
+
+    @pytest.fixture()
+    def _legacy_register_override(self, litestar_users_config: LitestarUsersConfig) -> None:
+        litestar_users_config.user_service_class = LegacyRegisterUserService
+
     def test_basic_registration(self, client: TestClient) -> None:
         response = client.post(
             "/register", json={"email": "someone@example.com", "username": "generic", "password": "something"}
@@ -77,3 +93,20 @@ class TestRegistration:
             "is_active": True,
             "is_verified": False,
         }
+
+    @pytest.mark.usefixtures("_send_token_in_background")
+    def test_registration_send_token_in_background(self, client: TestClient) -> None:
+        with patch.object(UserService, "send_verification_token") as send_verification_token:
+            response = client.post(
+                "/register", json={"email": "someone@example.com", "username": "generic", "password": "something"}
+            )
+        assert response.status_code == 201
+        assert response.json()["is_verified"] is False
+        send_verification_token.assert_called_once()
+
+    @pytest.mark.usefixtures("_legacy_register_override")
+    def test_registration_with_overridden_register(self, client: TestClient) -> None:
+        response = client.post(
+            "/register", json={"email": "someone@example.com", "username": "generic", "password": "something"}
+        )
+        assert response.status_code == 201
@@ -6,11 +6,18 @@ import pytest
 if TYPE_CHECKING:
     from litestar.testing import TestClient
 
+    from litestar_users import LitestarUsersConfig
+
     from .conftest import Role, User
 
 
 @pytest.mark.usefixtures("authenticate_admin")
 class TestRoleManagement:
+    @pytest.fixture()
+    def _minimal_assignment_response(self, litestar_users_config: "LitestarUsersConfig") -> None:
+        assert litestar_users_config.role_management_handler_config is not None
+        litestar_users_config.role_management_handler_config.minimal_assignment_response = True
+
     def test_create_role(self, client: "TestClient") -> None:
         response = client.post("/users/roles", json={"name": "editor", "description": "..."})
         assert response.status_code == 201
@@ -44,3 +51,32 @@ class TestRoleManagement:
             "/users/roles/revoke", json={"user_id": str(admin_user.id), "role_id": str(admin_role.id)}
         )
         assert response.status_code == 200
+
+    @pytest.mark.usefixtures("_minimal_assignment_response")
+    def test_assign_role_minimal_response(
+        self, client: "TestClient", generic_user: "User", writer_role: "Role"
+    ) -> None:
+        payload = {"user_id": str(generic_user.id), "role_id": str(writer_role.id)}
+        response = client.put("/users/roles/assign", json=payload)
+        assert response.status_code == 200
+        assert response.json() == payload
+
+        # the role was persisted, so assigning it again conflicts.
+        response = client.put("/users/roles/assign", json=payload)
+        assert response.status_code == 409
+
+    @pytest.mark.usefixtures("_minimal_assignment_response")
+    def test_revoke_role_minimal_response(
+        self, client: "TestClient", generic_user: "User", writer_role: "Role"
+    ) -> None:
+        payload = {"user_id": str(generic_user.id), "role_id": str(writer_role.id)}
+        response = client.put("/users/roles/assign", json=payload)
+        assert response.status_code == 200
+
+        response = client.put("/users/roles/revoke", json=payload)
+        assert response.status_code == 200
+        assert response.json() == payload
+
+        # the role was removed, so revoking it again conflicts.
+        response = client.put("/users/roles/revoke", json=payload)
+        assert response.status_code == 409
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from litestar_users.cache import TTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> Iterator[Clock]:
+    clock = Clock()
+    with patch("litestar_users.cache.monotonic", clock):
+        yield clock
+
+
+def test_get_and_contains(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    assert "a" in cache
+    assert cache.get("a") == 1
+    assert "b" not in cache
+    assert cache.get("b", 2) == 2
+
+
+def test_expiry(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    clock.now = 9.9
+    assert "a" in cache
+    clock.now = 10
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_reinsert_refreshes_ttl_and_order(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    clock.now = 5
+    cache.set("b", 2)
+    cache.set("a", 3)
+    clock.now = 12
+    assert "a" in cache
+    assert cache.get("a") == 3
+    # "b" is now the oldest entry and is evicted first.
+    cache.set("c", 4)
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+
+
+def test_evicts_oldest_at_maxsize(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert "a" not in cache
+    assert "b" in cache
+    assert "c" in cache
+
+
+def test_expired_entries_are_dropped_before_eviction(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    clock.now = 5
+    cache.set("b", 2)
+    clock.now = 11
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert "b" in cache
+    assert "c" in cache
+
+
+def test_clear(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.clear()
+    assert len(cache) == 0
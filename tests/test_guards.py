@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+from litestar.datastructures import State
+from litestar.exceptions import NotAuthorizedException
+
+from litestar_users.guards import ROLE_NAMES_STATE_KEY, roles_accepted, roles_required
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from litestar.connection import ASGIConnection
+
+
+class Roles:
+    """Role collection that counts how often it is iterated."""
+
+    def __init__(self, *names: str) -> None:
+        self.roles = [SimpleNamespace(name=name) for name in names]
+        self.iterations = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        self.iterations += 1
+        return iter(self.roles)
+
+
+def make_connection(roles: Roles) -> ASGIConnection:
+    return cast("ASGIConnection", SimpleNamespace(user=SimpleNamespace(roles=roles), state=State()))
+
+
+def test_guards_share_role_names() -> None:
+    roles = Roles("administrator", "writer")
+    connection = make_connection(roles)
+
+    roles_accepted("administrator")(connection, None)  # type: ignore[arg-type]
+    role_names = connection.state[ROLE_NAMES_STATE_KEY]
+    roles_required("administrator", "writer")(connection, None)  # type: ignore[arg-type]
+
+    assert roles.iterations == 1
+    assert connection.state[ROLE_NAMES_STATE_KEY] is role_names
+    assert role_names == frozenset({"administrator", "writer"})
+
+
+def test_second_guard_rejects_from_shared_role_names() -> None:
+    roles = Roles("writer")
+    connection = make_connection(roles)
+
+    roles_accepted("administrator", "writer")(connection, None)  # type: ignore[arg-type]
+    with pytest.raises(NotAuthorizedException):
+        roles_required("administrator")(connection, None)  # type: ignore[arg-type]
+
+    assert roles.iterations == 1
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from jose import JWTError
+from litestar.security.jwt import Token
+
+from litestar_users.exceptions import InvalidTokenException
+from litestar_users.service import TOKEN_EXPIRATION, BaseUserService
+from tests.constants import ENCODING_SECRET, HASH_SCHEMES
+
+
+def make_service(secret: str = ENCODING_SECRET) -> BaseUserService:
+    return BaseUserService(
+        secret=secret,
+        user_auth_identifier="email",
+        user_repository=MagicMock(),
+        hash_schemes=HASH_SCHEMES,
+    )
+
+
+class TestTokenCache:
+    def test_cache_hit_skips_decode(self) -> None:
+        service = make_service()
+        encoded_token = service.generate_token(uuid4(), aud="verify")
+        token = service._decode_and_verify_token(encoded_token, context="verify")
+
+        with patch.object(Token, "decode") as decode:
+            assert service._decode_and_verify_token(encoded_token, context="verify") is token
+        decode.assert_not_called()
+
+    def test_expired_cached_token_is_decoded_again(self) -> None:
+        service = make_service()
+        encoded_token = service.generate_token(uuid4(), aud="verify")
+        service._decode_and_verify_token(encoded_token, context="verify")
+
+        class FutureDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):  # type: ignore[no-untyped-def,override]
+                return datetime.now(tz) + TOKEN_EXPIRATION + timedelta(seconds=1)
+
+        with patch("litestar_users.service.datetime", FutureDatetime), patch.object(
+            Token, "decode", side_effect=JWTError("Signature has expired.")
+        ) as decode, pytest.raises(InvalidTokenException):
+            service._decode_and_verify_token(encoded_token, context="verify")
+        decode.assert_called_once()
+
+    def test_cache_hit_checks_aud(self) -> None:
+        service = make_service()
+        encoded_token = service.generate_token(uuid4(), aud="verify")
+        service._decode_and_verify_token(encoded_token, context="verify")
+
+        with patch.object(Token, "decode") as decode, pytest.raises(InvalidTokenException):
+            service._decode_and_verify_token(encoded_token, context="reset_password")
+        decode.assert_not_called()
+
+    def test_cache_is_keyed_on_secret(self) -> None:
+        service = make_service()
+        encoded_token = service.generate_token(uuid4(), aud="verify")
+        service._decode_and_verify_token(encoded_token, context="verify")
+
+        other_service = make_service(secret="fedcba0987654321")
+        with patch.object(
+            Token, "decode", side_effect=JWTError("Signature verification failed.")
+        ) as decode, pytest.raises(InvalidTokenException):
+            other_service._decode_and_verify_token(encoded_token, context="verify")
+        decode.assert_called_once_with(encoded_token=encoded_token, secret="fedcba0987654321", algorithm="HS256")